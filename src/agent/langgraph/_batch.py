@@ -0,0 +1,26 @@
+import asyncio
+
+
+async def run_many(app, inputs, max_concurrency=8):
+    """
+    Run a compiled graph over many inputs concurrently.
+
+    At most max_concurrency runs are in flight at once so a large batch does
+    not exceed the provider's rate limits; 429s inside a run are retried by
+    the chat models' own max_retries backoff.
+
+    Args:
+        app: The compiled graph.
+        inputs: Initial graph states, one per run.
+        max_concurrency: Maximum number of concurrent graph runs.
+
+    Returns:
+        The final states, in the same order as inputs.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run_one(state):
+        async with semaphore:
+            return await app.ainvoke(state)
+
+    return await asyncio.gather(*(run_one(state) for state in inputs))
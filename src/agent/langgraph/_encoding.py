@@ -0,0 +1,39 @@
+import binascii
+import os
+from functools import lru_cache, partial
+from pathlib import Path
+
+# Test files live under $APY_TEST_ROOT (defaults to the repo checkout in ~/Documents)
+BASE_PATH = Path(os.environ.get("APY_TEST_ROOT", Path.home() / "Documents/project/Advanced-Python/test"))
+
+# Files above this size are encoded chunk by chunk instead of in one buffer.
+_CHUNKED_ABOVE = 16 * 1024 * 1024
+# 57 bytes is one full base64 line (76 chars, no padding); a multiple of it
+# keeps every chunk on a 3-byte group boundary so the pieces concatenate.
+_CHUNK_SIZE = 57 * 4096
+
+
+@lru_cache(maxsize=32)
+def encode_file_to_base64(file_path: str, mtime_ns: int) -> str:
+    """
+    Read a file and encode its content to a base64 string.
+
+    The result is cached per (path, mtime) so an unchanged file is only
+    read and encoded once; touching the file invalidates the entry.
+
+    Args:
+        file_path: Path to the file.
+        mtime_ns: Modification time of the file, used as part of the cache key.
+
+    Returns:
+        Base64 encoded string of the file content.
+    """
+    with open(file_path, "rb") as file:
+        if os.fstat(file.fileno()).st_size <= _CHUNKED_ABOVE:
+            return binascii.b2a_base64(file.read(), newline=False).decode("ascii")
+
+        # Large file: encode in small chunks to keep the working set in cache
+        return "".join(
+            binascii.b2a_base64(chunk, newline=False).decode("ascii")
+            for chunk in iter(partial(file.read, _CHUNK_SIZE), b"")
+        )
@@ -0,0 +1,108 @@
+import hashlib
+import inspect
+import pickle
+import shelve
+import threading
+import time
+from functools import wraps
+from pathlib import Path
+
+import orjson
+
+from _redact import redact_base64
+
+
+# dbm backends do not support concurrent writers (gdbm refuses a second one, dbm.dumb
+# drops writes), and sync nodes run in executor threads, so every open of any cache
+# file goes through this lock.
+_db_lock = threading.Lock()
+
+
+def _to_jsonable(obj):
+    """orjson fallback for LangChain messages, with base64 payloads reduced to a digest."""
+    # MessagesState's add_messages reducer stamps each message with a random uuid id,
+    # so the id must stay out of the key or identical conversations never hit
+    return redact_base64(obj.model_dump(exclude={"id"}))
+
+
+def _make_key(func, llm, state) -> str:
+    """
+    Build a stable cache key for a node call.
+
+    Args:
+        func: The node function being cached.
+        llm: Zero-argument callable returning the chat model the node calls;
+            its model id, temperature and other generation params become
+            part of the key.
+        state: The graph state passed to the node.
+
+    Returns:
+        A blake2b hex digest of the node name, llm params and serialized state.
+    """
+    payload = b"||".join([
+        func.__qualname__.encode("utf-8"),
+        llm()._get_llm_string().encode("utf-8"),
+        orjson.dumps(state, default=_to_jsonable, option=orjson.OPT_SORT_KEYS),
+    ])
+    return hashlib.blake2b(payload, digest_size=32).hexdigest()
+
+
+def llm_cache(llm, ttl=None, path="~/.cache/langgraph_llm"):
+    """
+    Cache the output of a graph node on disk, keyed by llm params and state.
+
+    Identical inputs (same model, temperature and messages) skip the LLM
+    round-trip entirely and return the stored node output instead.
+
+    Args:
+        llm: Zero-argument callable returning the chat model used inside the
+            node. It is only called when the node runs, so decorating a node
+            does not construct the model.
+        ttl: Seconds an entry stays valid, or None to keep it forever.
+        path: Location of the shelve database.
+
+    Returns:
+        A decorator for sync or async node functions.
+    """
+    db_path = Path(path).expanduser()
+
+    def open_db():
+        # Created on first use, not at decoration time, so importing a module of nodes touches no files
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        return shelve.open(str(db_path), protocol=pickle.HIGHEST_PROTOCOL)
+
+    def lookup(key):
+        with _db_lock, open_db() as db:
+            entry = db.get(key)
+        if entry is None:
+            return None
+        timestamp, output = entry
+        if ttl is not None and time.time() - timestamp > ttl:
+            return None
+        return output
+
+    def store(key, output):
+        with _db_lock, open_db() as db:
+            db[key] = (time.time(), output)
+
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def wrapper(state):
+                key = _make_key(func, llm, state)
+                output = lookup(key)
+                if output is None:
+                    output = await func(state)
+                    store(key, output)
+                return output
+        else:
+            @wraps(func)
+            def wrapper(state):
+                key = _make_key(func, llm, state)
+                output = lookup(key)
+                if output is None:
+                    output = func(state)
+                    store(key, output)
+                return output
+        return wrapper
+    return decorator
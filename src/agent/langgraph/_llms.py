@@ -0,0 +1,158 @@
+import asyncio
+import weakref
+from functools import cached_property, lru_cache
+
+# Provider SDKs are imported inside the factories, so a demo that only uses
+# Claude never imports (or configures) langchain_openai, and vice versa.
+
+_HTTP_LIMITS = dict(max_keepalive_connections=32, max_connections=64)
+
+# event loop -> {(builder, settings): chat model}. An async HTTP client's pooled
+# connections belong to the loop that opened them, so each asyncio.run() gets its
+# own models and async clients instead of reusing connections from a closed loop.
+_models_by_loop = weakref.WeakKeyDictionary()
+
+
+def _for_running_loop(build, *settings):
+    """
+    Return build(*settings), built once per running event loop.
+
+    Args:
+        build: Factory that creates a chat model with its own async client.
+        settings: Model settings passed to build; also the cache key.
+
+    Returns:
+        The model for the current loop, or None when no loop is running
+        (sync callers, e.g. a sync node in an executor thread).
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+    models = _models_by_loop.setdefault(loop, {})
+    key = (build, settings)
+    if key not in models:
+        models[key] = build(*settings)
+    return models[key]
+
+
+@lru_cache(maxsize=None)
+def _shared_http_client():
+    """
+    Build the sync httpx client shared by every OpenAI chat model.
+
+    One connection pool means repeated calls reuse keep-alive connections
+    instead of paying a new TLS handshake.
+
+    Returns:
+        An httpx.Client.
+    """
+    import httpx
+
+    return httpx.Client(limits=httpx.Limits(**_HTTP_LIMITS))
+
+
+def get_anthropic(model: str, temperature: float, max_tokens: int):
+    """
+    Return the shared ChatAnthropic instance for the given settings.
+
+    Called inside a running event loop, the instance is cached per loop and
+    its async client has its own connection pool, so a second asyncio.run()
+    in the same process never reuses connections from a closed loop. Sync
+    calls go through langchain_anthropic's process-wide httpx client.
+
+    Args:
+        model: Anthropic model name.
+        temperature: Sampling temperature.
+        max_tokens: Maximum number of tokens to generate.
+
+    Returns:
+        A ChatAnthropic built once per (model, temperature, max_tokens) and
+        event loop.
+    """
+    return (_for_running_loop(_build_loop_anthropic, model, temperature, max_tokens)
+            or _sync_anthropic(model, temperature, max_tokens))
+
+
+@lru_cache(maxsize=None)
+def _sync_anthropic(model: str, temperature: float, max_tokens: int):
+    """ChatAnthropic for callers outside an event loop."""
+    from langchain_anthropic import ChatAnthropic
+
+    return ChatAnthropic(model=model, temperature=temperature, max_tokens=max_tokens, streaming=True)
+
+
+@lru_cache(maxsize=None)
+def _loop_anthropic_class():
+    """
+    ChatAnthropic subclass whose async client owns its connection pool.
+
+    ChatAnthropic takes no http_async_client argument; its default async
+    client comes from an lru_cached, process-wide httpx client, so a new
+    instance alone would still reuse connections from a closed loop.
+    """
+    import anthropic
+    from langchain_anthropic import ChatAnthropic
+
+    class LoopChatAnthropic(ChatAnthropic):
+        @cached_property
+        def _async_client(self) -> anthropic.AsyncClient:
+            # No http_client: the SDK builds a fresh one for this client
+            return anthropic.AsyncClient(**self._client_params)
+
+    return LoopChatAnthropic
+
+
+def _build_loop_anthropic(model, temperature, max_tokens):
+    return _loop_anthropic_class()(model=model, temperature=temperature, max_tokens=max_tokens, streaming=True)
+
+
+def get_openai(model: str, temperature: float, max_tokens: int):
+    """
+    Return the shared ChatOpenAI instance for the given settings.
+
+    Called inside a running event loop, the instance is cached per loop and
+    owns an httpx.AsyncClient bound to that loop, so a second asyncio.run()
+    in the same process never reuses connections from a closed loop.
+
+    Args:
+        model: OpenAI model name.
+        temperature: Sampling temperature.
+        max_tokens: Maximum number of tokens to generate.
+
+    Returns:
+        A ChatOpenAI built once per (model, temperature, max_tokens) and event
+        loop, wired to the module's shared sync httpx client.
+    """
+    return (_for_running_loop(_build_loop_openai, model, temperature, max_tokens)
+            or _sync_openai(model, temperature, max_tokens))
+
+
+@lru_cache(maxsize=None)
+def _sync_openai(model: str, temperature: float, max_tokens: int):
+    """ChatOpenAI for callers outside an event loop; only its sync client is shared."""
+    return _build_openai(model, temperature, max_tokens)
+
+
+def _build_loop_openai(model, temperature, max_tokens):
+    import httpx
+
+    return _build_openai(
+        model, temperature, max_tokens,
+        http_async_client=httpx.AsyncClient(limits=httpx.Limits(**_HTTP_LIMITS))
+    )
+
+
+def _build_openai(model, temperature, max_tokens, **clients):
+    """Construct a ChatOpenAI on the shared sync client, plus any extra client kwargs."""
+    from langchain_openai import ChatOpenAI
+
+    return ChatOpenAI(
+        model=model,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        http_client=_shared_http_client(),
+        streaming=True,
+        **clients
+    )
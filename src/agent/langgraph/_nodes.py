@@ -0,0 +1,38 @@
+from functools import lru_cache
+
+from langgraph.graph import StateGraph, MessagesState, START, END
+
+from _llm_cache import llm_cache
+from _llms import get_anthropic, get_openai
+
+
+# 1. LLMs used by the single-agent demos, built on first use
+def claude():
+    return get_anthropic("claude-sonnet-4-20250514", 0.7, 1024)
+
+def gpt():
+    return get_openai("gpt-4o", 0.8, 1024*64)
+
+
+# 2. call the llm based on the messages
+@llm_cache(claude)
+def call_claude(state):
+    response = claude().invoke(state["messages"])
+    return {"messages": [response]}
+
+@llm_cache(gpt)
+def call_gpt(state):
+    response = gpt().invoke(state["messages"])
+    return {"messages": [response]}
+
+
+# 3. build a graph for a single agent
+@lru_cache(maxsize=None)    # compile each (node_name, node_fn) graph once
+def build_single_llm_graph(node_name, node_fn):
+    graph = StateGraph(MessagesState)   # create a stategraph
+    graph.add_node(node_name, node_fn)  # add llm node: name, node(func)
+
+    graph.add_edge(START, node_name)    # add edge to build the graph
+    graph.add_edge(node_name, END)
+
+    return graph.compile()  # compile the graph
@@ -0,0 +1,31 @@
+import hashlib
+
+
+def redact_base64(value):
+    """
+    Replace inline base64 payloads with a short reference to their content.
+
+    Image and PDF messages carry the whole file as a base64 string; anything
+    that serializes them for a log line or a cache key only needs to know
+    which file it was, not its bytes.
+
+    Args:
+        value: A message content structure (dicts / lists of content blocks).
+
+    Returns:
+        A copy of value where every {"type": "base64", "data": ...} source is
+        replaced by {"type": "base64_ref", "sha256": ..., "bytes": ...}.
+    """
+    if isinstance(value, dict):
+        if value.get("type") == "base64" and isinstance(value.get("data"), str):
+            data = value["data"]
+            return {
+                "type": "base64_ref",
+                "media_type": value.get("media_type"),
+                "sha256": hashlib.sha256(data.encode("ascii")).hexdigest()[:16],
+                "bytes": len(data)
+            }
+        return {key: redact_base64(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [redact_base64(item) for item in value]
+    return value
@@ -0,0 +1,29 @@
+async def stream_graph(app, inputs, final_output, node=None):
+    """
+    Run a compiled graph and print chat model tokens as soon as they arrive.
+
+    Args:
+        app: The compiled graph.
+        inputs: The initial graph state.
+        final_output: Picks the text to print from the final state when no
+            tokens were streamed (e.g. the node output came from llm_cache).
+        node: Only stream tokens produced inside this graph node, or None to
+            stream every chat model call.
+
+    Returns:
+        The final graph state.
+    """
+    final_state = None
+    streamed = False
+    async for event in app.astream_events(inputs, version="v2"):
+        if event["event"] == "on_chat_model_stream":
+            if node is None or event["metadata"].get("langgraph_node") == node:
+                print(event["data"]["chunk"].content, end="", flush=True)
+                streamed = True
+        elif event["event"] == "on_chain_end" and not event["parent_ids"]:
+            final_state = event["data"]["output"]
+
+    if not streamed:
+        print(final_output(final_state), end="")
+    print()
+    return final_state
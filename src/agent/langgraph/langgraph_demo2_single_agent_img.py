@@ -1,51 +1,22 @@
-from langchain_anthropic import ChatAnthropic
-from langchain_openai import ChatOpenAI
-from langchain_core.messages import HumanMessage, SystemMessage
-from langgraph.graph import StateGraph, MessagesState, START, END
-
-# 1. Create a llm
-llm_anthropic = ChatAnthropic(
-    model="claude-sonnet-4-20250514",
-    temperature=0.7,
-    max_tokens=1024
-)
+import asyncio
 
-llm_openai = ChatOpenAI(
-    model="gpt-4o",
-    temperature=0.8,
-    max_tokens=1024*64
-)
+from langchain_core.messages import HumanMessage, SystemMessage
 
-# 2. call the llm based on the messages
-def call_claude(state):
-    response = llm_anthropic.invoke(state["messages"])
-    return {"messages": [response]}
+from _encoding import BASE_PATH, encode_file_to_base64
+from _nodes import call_claude, build_single_llm_graph
+from _streaming import stream_graph
 
-def call_gpt(state):
-    response = llm_openai.invoke(state["messages"])
-    return {"messages": [response]}
+IMAGE_PATH = BASE_PATH / "image/gemini_3_pro_benchmark_results.png"
 
-# 3. build a graph for an agent
+# 1. build a graph for an agent
 def build_graph():
-    graph = StateGraph(MessagesState)   # create a stategraph
-    graph.add_node("llm_anthropic", call_claude)    # add llm node: name, node(func)
-
-    graph.add_edge(START, "llm_anthropic")  # add edge to build the graph
-    graph.add_edge("llm_anthropic", END)
+    return build_single_llm_graph("llm_anthropic", call_claude)   # compiled once, shared with other demos
 
-    return graph.compile()  # compile the graph
 
-
-# 4. run the agent to call llm via state graph
-def main():
+# 2. run the agent to call llm via state graph
+async def main():
     # Read image and encode to base64
-    import base64
-    from pathlib import Path
-
-    image_path = Path.home() / "Documents/project/Advanced-Python/test/image/gemini_3_pro_benchmark_results.png"
-
-    with open(image_path, "rb") as image_file:
-        image_base64_gemini_3 = base64.b64encode(image_file.read()).decode("utf-8")
+    image_base64_gemini_3 = encode_file_to_base64(str(IMAGE_PATH), IMAGE_PATH.stat().st_mtime_ns)
 
     messages = {
         "messages": [
@@ -67,10 +38,10 @@ def main():
     }
    
     app = build_graph()
-    res = app.invoke(messages)
     print(f"User: Describe the image content in detail.")
-    print(f"Claude: {res['messages'][-1].content}")
+    print("Claude: ", end="", flush=True)
+    await stream_graph(app, messages, lambda state: state["messages"][-1].content)
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
@@ -1,53 +1,23 @@
-from langchain_anthropic import ChatAnthropic
-from langchain_openai import ChatOpenAI
-from langchain_core.messages import HumanMessage, SystemMessage
-from langgraph.graph import StateGraph, MessagesState, START, END
-
-# 1. Create a llm
-llm_anthropic = ChatAnthropic(
-    model="claude-sonnet-4-20250514",
-    temperature=0.7,
-    max_tokens=1024
-)
+import asyncio
+import sys
 
-llm_openai = ChatOpenAI(
-    model="gpt-4o",
-    temperature=0.8,
-    max_tokens=1024*64
-)
+from langchain_core.messages import HumanMessage, SystemMessage
 
-# 2. call the llm based on the messages
-def call_claude(state):
-    response = llm_anthropic.invoke(state["messages"])
-    return {"messages": [response]}
+from _batch import run_many
+from _encoding import BASE_PATH, encode_file_to_base64
+from _nodes import call_claude, build_single_llm_graph
+from _streaming import stream_graph
 
-def call_gpt(state):
-    response = llm_openai.invoke(state["messages"])
-    return {"messages": [response]}
+PDF_PATH = BASE_PATH / "pdf/DeepSeek_OCR_paper_page_1_demo.pdf"
 
-# 3. build a graph for an agent
+# 1. build a graph for an agent
 def build_graph():
-    graph = StateGraph(MessagesState)   # create a stategraph
-    graph.add_node("llm_anthropic", call_claude)    # add llm node: name, node(func)
-
-    graph.add_edge(START, "llm_anthropic")  # add edge to build the graph
-    graph.add_edge("llm_anthropic", END)
-
-    return graph.compile()  # compile the graph
-
-
-# 4. run the agent to call llm via state graph
-def main():
-    # Read pdf document and encode to base64
-    import base64
-    from pathlib import Path
+    return build_single_llm_graph("llm_anthropic", call_claude)   # compiled once, shared with other demos
 
-    pdf_path = Path.home() / "Documents/project/Advanced-Python/test/pdf/DeepSeek_OCR_paper_page_1_demo.pdf"
 
-    with open(pdf_path, "rb") as pdf_file:
-        pdf_base64_deepseek_orc_page_1 = base64.b64encode(pdf_file.read()).decode("utf-8")
-
-    messages = {
+# 2. build the messages for one pdf
+def create_pdf_messages(pdf_base64):
+    return {
         "messages": [
             SystemMessage(content="You are an expert in document analysis."),
             HumanMessage(
@@ -58,19 +28,36 @@ def main():
                         "source": {
                             "type": "base64",
                             "media_type": "application/pdf",
-                            "data" : pdf_base64_deepseek_orc_page_1
+                            "data" : pdf_base64
                     }
                 }
                 ]
             )
         ]
     }
-   
+
+
+# 3. run the agent to call llm via state graph
+async def main():
+    # Read pdf document and encode to base64
+    pdf_base64_deepseek_orc_page_1 = encode_file_to_base64(str(PDF_PATH), PDF_PATH.stat().st_mtime_ns)
+    messages = create_pdf_messages(pdf_base64_deepseek_orc_page_1)
+
     app = build_graph()
-    res = app.invoke(messages)
     print(f"User: Summarize the key points from this PDF.")
-    print(f"Claude: {res['messages'][-1].content}")
+    print("Claude: ", end="", flush=True)
+    await stream_graph(app, messages, lambda state: state["messages"][-1].content)
+
+
+# 4. summarize every pdf in the test folder concurrently: python langgraph_demo3_single_agent_pdf.py --batch
+async def main_batch():
+    pdf_paths = sorted((BASE_PATH / "pdf").glob("*.pdf"))
+    inputs = [create_pdf_messages(encode_file_to_base64(str(p), p.stat().st_mtime_ns)) for p in pdf_paths]
+
+    results = await run_many(build_graph(), inputs)
+    for path, state in zip(pdf_paths, results):
+        print(f"{path.name}: {state['messages'][-1].content}\n")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main_batch() if "--batch" in sys.argv else main())
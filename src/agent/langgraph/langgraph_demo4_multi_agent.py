@@ -1,24 +1,24 @@
-import base64
-from pathlib import Path
+import asyncio
+from functools import lru_cache
 from typing import TypedDict, List, Any, Dict
 
-from langchain_anthropic import ChatAnthropic
-from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage, SystemMessage, BaseMessage
 from langgraph.graph import StateGraph, START, END
 
-# 1. Create LLM instances
-llm_anthropic = ChatAnthropic(
-    model="claude-sonnet-4-20250514",
-    temperature=0.7,
-    max_tokens=1024*4
-)
+from _encoding import BASE_PATH, encode_file_to_base64
+from _llm_cache import llm_cache
+from _llms import get_anthropic, get_openai
+from _streaming import stream_graph
 
-llm_openai = ChatOpenAI(
-    model="gpt-4o",
-    temperature=0.8,
-    max_tokens=1024*4
-)
+PDF_PATH = BASE_PATH / "pdf/DeepSeek_OCR_paper_page_1_demo.pdf"
+IMAGE_PATH = BASE_PATH / "image/gemini_3_deepthink.png"
+
+# 1. LLM factories, built on first use
+def claude():
+    return get_anthropic("claude-sonnet-4-20250514", 0.7, 1024*4)
+
+def gpt():
+    return get_openai("gpt-4o", 0.8, 1024*4)
 
 
 # 2. Define a custom state
@@ -41,7 +41,8 @@ class MultiModalState(TypedDict):
 
 
 # 3. Define node functions
-def extract_image(state: MultiModalState) -> Dict[str, str]:
+@llm_cache(gpt)
+async def extract_image(state: MultiModalState) -> Dict[str, str]:
     """
     Extract image content from the image message using OpenAI.
 
@@ -51,11 +52,12 @@ def extract_image(state: MultiModalState) -> Dict[str, str]:
     Returns:
         A dictionary with the extracted image_content.
     """
-    response = llm_openai.invoke(state["image_messages"])
+    response = await gpt().ainvoke(state["image_messages"])
     return {"image_content": response.content}
 
 
-def summarize_pdf(state: MultiModalState) -> Dict[str, str]:
+@llm_cache(claude)
+async def summarize_pdf(state: MultiModalState) -> Dict[str, str]:
     """
     Summarize the PDF content from the document message using Anthropic.
 
@@ -65,11 +67,26 @@ def summarize_pdf(state: MultiModalState) -> Dict[str, str]:
     Returns:
         A dictionary with the summarized pdf_content.
     """
-    response = llm_anthropic.invoke(state["pdf_messages"])
+    response = await claude().ainvoke(state["pdf_messages"])
     return {"pdf_content": response.content}
 
 
-def process_image_and_pdf(state: MultiModalState) -> Dict[str, str]:
+async def extract_image_and_pdf(state: MultiModalState) -> Dict[str, str]:
+    """
+    Run the image and PDF extractors concurrently inside a single graph step.
+
+    Args:
+        state: The current graph state containing image_messages and pdf_messages.
+
+    Returns:
+        A dictionary with both image_content and pdf_content.
+    """
+    image_update, pdf_update = await asyncio.gather(extract_image(state), summarize_pdf(state))
+    return {**image_update, **pdf_update}
+
+
+@llm_cache(gpt)
+async def process_image_and_pdf(state: MultiModalState) -> Dict[str, str]:
     """
     Combine and analyze both image and PDF content to generate a final summary.
 
@@ -80,7 +97,7 @@ def process_image_and_pdf(state: MultiModalState) -> Dict[str, str]:
         A dictionary with the final_summary.
     """
     combined_content = f"Image Content: {state['image_content']}\n\nPDF Content: {state['pdf_content']}"
-    response = llm_openai.invoke([
+    response = await gpt().ainvoke([
         SystemMessage(content="You are an expert in analyzing images and documents."),
         HumanMessage(content=(
             f"Combine and analyze the following content:\n{combined_content}\n"
@@ -91,55 +108,48 @@ def process_image_and_pdf(state: MultiModalState) -> Dict[str, str]:
 
 
 # 4. Build the graph
+@lru_cache(maxsize=1)
 def build_graph() -> StateGraph:
     """
     Build and compile the state graph for the multi-modal agent.
 
+    The compiled graph is cached, so repeated calls return the same app.
+
     Returns:
         The compiled StateGraph.
     """
     graph = StateGraph(MultiModalState)
 
     # Add nodes
-    graph.add_node("image_extractor", extract_image)
-    graph.add_node("pdf_extractor", summarize_pdf)
+    graph.add_node("image_pdf_extractor", extract_image_and_pdf)
     graph.add_node("combined_summerizor", process_image_and_pdf)
 
     # Define edges
-    graph.add_edge(START, "image_extractor")
-    graph.add_edge(START, "pdf_extractor")
-
-    graph.add_edge("image_extractor", "combined_summerizor")
-    graph.add_edge("pdf_extractor", "combined_summerizor")
-
+    graph.add_edge(START, "image_pdf_extractor")
+    graph.add_edge("image_pdf_extractor", "combined_summerizor")
     graph.add_edge("combined_summerizor", END)
 
     return graph.compile()
 
 
 # 5. Helper functions for main execution
-def encode_file_to_base64(file_path: Path) -> str:
-    """
-    Read a file and encode its content to a base64 string.
 
-    Args:
-        file_path: Path to the file.
+# Fixed parts of the prompts, built once and shared by every message list
+_PDF_SYSTEM_MESSAGE = SystemMessage(content="You are an expert in pdf document analysis.")
+_PDF_TEXT_BLOCK = {"type": "text", "text": "Summarize the key points from this PDF."}
 
-    Returns:
-        Base64 encoded string of the file content.
-    """
-    with open(file_path, "rb") as file:
-        return base64.b64encode(file.read()).decode("utf-8")
+_IMAGE_SYSTEM_MESSAGE = SystemMessage(content="You are an expert in image analysis.")
+_IMAGE_TEXT_BLOCK = {"type": "text", "text": "Extract the insights from the image."}
 
 
 def create_pdf_messages(pdf_base64: str) -> Dict[str, List[BaseMessage]]:
     """Create the message structure for PDF analysis."""
     return {
         "pdf_messages": [
-            SystemMessage(content="You are an expert in pdf document analysis."),
+            _PDF_SYSTEM_MESSAGE,
             HumanMessage(
                 content=[
-                    {"type": "text", "text": "Summarize the key points from this PDF."},
+                    _PDF_TEXT_BLOCK,
                     {
                         "type": "document",
                         "source": {
@@ -158,10 +168,10 @@ def create_image_messages(image_base64: str) -> Dict[str, List[BaseMessage]]:
     """Create the message structure for image analysis."""
     return {
         "image_messages": [
-            SystemMessage(content="You are an expert in image analysis."),
+            _IMAGE_SYSTEM_MESSAGE,
             HumanMessage(
                 content=[
-                    {"type": "text", "text": "Extract the insights from the image."},
+                    _IMAGE_TEXT_BLOCK,
                     {
                         "type": "image",
                         "source": {
@@ -176,17 +186,14 @@ def create_image_messages(image_base64: str) -> Dict[str, List[BaseMessage]]:
     }
 
 
-def main():
+async def main():
     """Main execution function."""
-    # Define paths
-    base_path = Path.home() / "Documents/project/Advanced-Python/test"
-    pdf_path = base_path / "pdf/DeepSeek_OCR_paper_page_1_demo.pdf"
-    img_path = base_path / "image/gemini_3_deepthink.png"
-
-    # Encode files
+    # Encode files in worker threads so both reads overlap
     try:
-        pdf_base64 = encode_file_to_base64(pdf_path)
-        image_base64 = encode_file_to_base64(img_path)
+        pdf_base64, image_base64 = await asyncio.gather(
+            asyncio.to_thread(encode_file_to_base64, str(PDF_PATH), PDF_PATH.stat().st_mtime_ns),
+            asyncio.to_thread(encode_file_to_base64, str(IMAGE_PATH), IMAGE_PATH.stat().st_mtime_ns)
+        )
     except FileNotFoundError as e:
         print(f"Error: File not found - {e}")
         return
@@ -203,11 +210,10 @@ def main():
     # Run graph
     app = build_graph()
     print("Running multi-modal agent...")
-    res = app.invoke(init_messages)
-    
     print(f"\nUser: Summarize the key points from uploaded image and PDF.")
-    print(f"Claude: {res['final_summary']}")
+    print("Claude: ", end="", flush=True)
+    await stream_graph(app, init_messages, lambda state: state["final_summary"], node="combined_summerizor")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
@@ -0,0 +1,59 @@
+"""
+Build decorator wrappers with the exact signature of the decorated function.
+    1. A normal wrapper is def wrapper(*args, **kwargs), so every call packs a tuple and a dict
+    2. If func only takes plain positional-or-keyword params (e.g. add(a, b)),
+       we can generate def wrapper(a, b) with exec and call func(a, b) directly
+    3. Anything else (*args, **kwargs, defaults, keyword-only, or a param named like a name
+       the wrapper body uses, e.g. time) falls back to the generic wrapper
+"""
+import inspect
+import linecache
+import re
+from functools import update_wrapper
+from string import Template
+
+_IDENTIFIER_RE = re.compile(r"[A-Za-z_]\w*")
+
+
+def fixed_params(func, reserved=frozenset()):
+    """
+    Return "a, b" if func has only plain positional-or-keyword params without defaults, else None.
+        reserved: names the wrapper body uses; a param with one of these names would shadow it
+    """
+    try:
+        params = inspect.signature(func).parameters.values()
+    except (TypeError, ValueError):     # builtins without a signature
+        return None
+    if all(p.kind is p.POSITIONAL_OR_KEYWORD and p.default is p.empty and p.name not in reserved
+           for p in params):
+        return ", ".join(p.name for p in params)
+    return None
+
+
+def specialize(func, template, **namespace):
+    """
+    Compile a wrapper from template and copy func's metadata onto it.
+        template placeholders:
+        - $params  the wrapper's parameter list, also used to call func($params)
+        - $args    expression for the positional arguments (a tuple)
+        - $kwargs  expression for the keyword arguments (a dict)
+        namespace: globals the wrapper body needs, e.g. time=time
+    """
+    # e.g. def f(time) must not turn the template's time.perf_counter_ns() into an int lookup
+    reserved = set(_IDENTIFIER_RE.findall(template)) | set(namespace) | {"func"}
+    params = fixed_params(func, reserved)
+    if params is None:
+        subs = {"params": "*args, **kwargs", "args": "args", "kwargs": "kwargs"}
+    elif params:
+        subs = {"params": params, "args": f"({params},)", "kwargs": "dict()"}
+    else:
+        subs = {"params": "", "args": "()", "kwargs": "dict()"}
+
+    # Give the generated code a filename and register its source, so tracebacks show the wrapper's lines
+    source = Template(template).substitute(subs)
+    filename = f"<wrapper of {func.__module__}.{func.__qualname__}>"
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+
+    scope = dict(namespace, func=func)
+    exec(compile(source, filename, "exec"), scope)
+    return update_wrapper(scope["wrapper"], func)   # same job as @wraps(func)
@@ -1,10 +1,23 @@
 from functools import wraps
+import inspect
+
+VALIDATED_USERS = frozenset(("John", "Feng", "Mike", "Jennie"))   # built once, O(1) membership
 
 def auth(func):
+    # Find where "user" sits in the signature once, at decoration time
+    params = inspect.signature(func).parameters
+    user_param = params.get("user")
+    if user_param is None or user_param.kind in (user_param.VAR_POSITIONAL, user_param.VAR_KEYWORD):
+        raise TypeError("auth requires a 'user' parameter")
+    # A keyword-only user (e.g. f(*tables, user)) never comes from args: args[i] would be a table
+    user_idx = None if user_param.kind is user_param.KEYWORD_ONLY else list(params).index("user")
+
     @wraps(func)
     def wrapper(*args, **kwargs):   # Pass all positional arguments or keyword arguments to the wrapper
-        VALIDATED_USERS = ["John", "Feng", "Mike", "Jennie"]
-        user = args[0] if args else kwargs.get("user")
+        if user_idx is not None and len(args) > user_idx:
+            user = args[user_idx]
+        else:
+            user = kwargs.get("user")
         if user not in VALIDATED_USERS:
             raise PermissionError("Invalid user!")
         return func(*args, **kwargs)
@@ -16,5 +29,6 @@ def view_database(user, database_name):
     print(f"{database_name} is open by {user}.")
 
 
-# view_database(user="Feng", database_name="dev.bronze")
-view_database(user="Hacker", database_name="prod.gold")
\ No newline at end of file
+if __name__ == "__main__":
+    # view_database(user="Feng", database_name="dev.bronze")
+    view_database(user="Hacker", database_name="prod.gold")
\ No newline at end of file
@@ -10,9 +10,23 @@ def fibonacci(n):
         @return: The nth Fibonacci number.
     """
 
-	if n < 2:
-		return n
-	return fibonacci(n-1) + fibonacci(n-2)
+	if n < 0:	# n >> 1 never reaches 0 for negative n, so _fib_pair would recurse forever
+		raise ValueError(f"n must be non-negative, got {n}")
+	return _fib_pair(n)[0]
+
+
+def _fib_pair(n):
+	"""
+    Fast doubling: returns (F(n), F(n+1)) in O(log n) steps.
+        F(2k)   = F(k) * (2*F(k+1) - F(k))
+        F(2k+1) = F(k)^2 + F(k+1)^2
+    """
+	if n == 0:
+		return (0, 1)
+	a, b = _fib_pair(n >> 1)
+	c = a * ((b << 1) - a)
+	d = a * a + b * b
+	return (c, d) if n & 1 == 0 else (d, c + d)
 
 
 # Calculate the 35th Fibonacci number
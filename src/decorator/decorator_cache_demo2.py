@@ -1,30 +1,80 @@
+from collections import OrderedDict
 from functools import wraps
+from hashlib import blake2b
+import pickle
 import time
 import asyncio
 
-def async_cache(ttl_seconds=300):
+def _freeze(obj):
+    """Turn dicts into sorted item tuples (recursively), so key order never changes the cache key."""
+    if isinstance(obj, dict):
+        return (dict, tuple(sorted((k, _freeze(v)) for k, v in obj.items())))
+    if isinstance(obj, (list, tuple)):
+        return (type(obj), tuple(_freeze(v) for v in obj))
+    return obj
+
+
+def _make_key(args, kwargs):
+    """16-byte digest of the call's arguments, or None if they cannot be pickled (clients, sessions, locks)."""
+    try:
+        blob = pickle.dumps(_freeze((args, kwargs)), protocol=5)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return None
+    return blake2b(blob, digest_size=16).digest()
+
+
+def async_cache(ttl_seconds=300, maxsize=1024):
     """
-        1. async_cache(ttl_seconds)
+        1. async_cache(ttl_seconds, maxsize)
         2. decorator(func)
         3. wrapper(*args, **kwargs)  -- call orignal func with @wraps(func)
     """
     def decorator(func):    # decorator should be used to wrap the real wrapper
-        cache = {}
+        cache = OrderedDict()   # key -> (res, timestamp), least recently used first
+        pending = {}            # key -> asyncio.Future of the call currently fetching it
 
         @wraps(func)
         async def wrapper(*args, **kwargs): # Must be a aysnc wrapper
-            key = str(args) + str(kwargs)
+            # Fixed-size key that ignores dict key order
+            key = _make_key(args, kwargs)
+            if key is None:     # unpicklable arguments: skip the cache rather than fail the call
+                return await func(*args, **kwargs)
 
             # Cache hits
             if key in cache:
                 res, timestamp = cache[key]
                 if time.time() - timestamp <= ttl_seconds:
+                    cache.move_to_end(key)
                     print(f"Cache is used for {func.__name__}")
                     return res
-                
+
+            # Single flight: someone is already fetching this key, wait for their result
+            if key in pending:
+                # shield: a waiter that gets cancelled (e.g. wait_for timeout) must not cancel the shared future
+                return await asyncio.shield(pending[key])
+
             # Cache misses
-            res = await func(*args, **kwargs)
+            fut = asyncio.get_running_loop().create_future()
+            pending[key] = fut
+            try:
+                res = await func(*args, **kwargs)
+            except asyncio.CancelledError:
+                fut.cancel()            # the leader gave up, so its waiters do too
+                raise
+            except Exception as e:
+                if not fut.done():
+                    fut.set_exception(e)    # waiters see the same error
+                    fut.exception()         # mark it retrieved in case nobody was waiting
+                raise
+            finally:
+                pending.pop(key, None)
+
+            if not fut.done():
+                fut.set_result(res)
             cache[key] = (res, time.time())
+            cache.move_to_end(key)
+            if len(cache) > maxsize:
+                cache.popitem(last=False)   # evict the least recently used
             return res
         return wrapper
     return decorator
@@ -1,11 +1,18 @@
 import logging
+
+from _specialize import specialize
+
+LOGGER_WRAPPER = """
+def wrapper($params):
+    logging.info(f"Calling {func.__name__} with args: {$args}, kwargs: {$kwargs}")
+    result = func($params)
+    logging.info(f"{func.__name__} returned: {result}")
+    return result
+"""
+
 def logger(func): 
-    def wrapper(*args, **kwargs): 
-        logging.info(f"Calling {func.__name__} with args: {args}, kwargs: {kwargs}") 
-        result = func(*args, **kwargs) 
-        logging.info(f"{func.__name__} returned: {result}") 
-        return result 
-    return wrapper
+    # wrapper is generated with func's exact signature to skip *args/**kwargs packing
+    return specialize(func, LOGGER_WRAPPER, logging=logging)
 
 """A decorator that logs function calls."""
 logging.basicConfig(filename="./my_app.log",level=logging.INFO) 
@@ -1,15 +1,21 @@
 import time
 import numpy as np
 
+from _specialize import specialize
+
+TIMER_WRAPPER = """
+def wrapper($params):
+    start_time = time.perf_counter_ns()
+    result = func($params)
+    end_time = time.perf_counter_ns()
+    print(f"Function {func.__name__} took {(end_time - start_time) / 1e9:.6f}s to execute.")
+    return result
+"""
+
 def timer(func):
     """A decorator that prints the time taken by the decorated function."""
-    def wrapper(*args, **kwargs):
-        start_time = time.time()
-        result = func(*args, **kwargs)
-        end_time = time.time()
-        print(f"Function {func.__name__} took {end_time - start_time:.6f}s to execute.")
-        return result
-    return wrapper
+    # wrapper gets func's exact signature, e.g. def wrapper(a, b), so no *args/**kwargs packing per call
+    return specialize(func, TIMER_WRAPPER, time=time)
 
 @timer
 def add(a, b):
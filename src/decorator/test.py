@@ -1,13 +1,16 @@
-from functools import wraps
+from _specialize import specialize
+
+LOG_IO_WRAPPER = """
+def wrapper($params):
+    print(f"[call] {func.__name__} args={$args}, kwargs={$kwargs}")
+    result = func($params)
+    print(f"[ret ] {func.__name__} -> {result}")
+    return result
+"""
 
 def log_io(func):
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        print(f"[call] {func.__name__} args={args}, kwargs={kwargs}")
-        result = func(*args, **kwargs)
-        print(f"[ret ] {func.__name__} -> {result}")
-        return result
-    return wrapper
+    # wrapper is generated with func's exact signature, e.g. def wrapper(a, b)
+    return specialize(func, LOG_IO_WRAPPER)
 
 @log_io
 def add(a, b):
@@ -22,25 +25,47 @@ print(add(1, 2))
 3
 """
 
-from functools import wraps
+import asyncio
+import inspect
+import random
 import time
 
-def retry(times=3, delay=0.1):
+# Exponential backoff with jitter: delay * 2**i + U(0, jitter), capped at max_delay
+RETRY_WRAPPER = """
+def wrapper($params):
+    for i in range(times):
+        try:
+            return func($params)
+        except exceptions:
+            if i == times - 1:
+                raise
+            time.sleep(min(delay * 2 ** i + random.uniform(0, jitter), max_delay))
+"""
+
+# Same loop for coroutines, but sleeping without blocking the event loop
+ASYNC_RETRY_WRAPPER = """
+async def wrapper($params):
+    for i in range(times):
+        try:
+            return await func($params)
+        except exceptions:
+            if i == times - 1:
+                raise
+            await asyncio.sleep(min(delay * 2 ** i + random.uniform(0, jitter), max_delay))
+"""
+
+def retry(times=3, delay=0.1, max_delay=5.0, jitter=0.1, exceptions=(Exception,)):
+    if times < 1:   # with times <= 0 the loop never runs and func would never be called
+        raise ValueError(f"retry times must be at least 1, got {times}")
+
     def deco(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            last_exc = None
-            for _ in range(times):
-                try:
-                    return func(*args, **kwargs)
-                except Exception as e:
-                    last_exc = e
-                    time.sleep(delay)
-            raise last_exc
-        return wrapper
+        template = ASYNC_RETRY_WRAPPER if inspect.iscoroutinefunction(func) else RETRY_WRAPPER
+        return specialize(func, template, asyncio=asyncio, random=random, time=time,
+                          times=times, delay=delay, max_delay=max_delay, jitter=jitter,
+                          exceptions=exceptions)
     return deco
 
-@retry(times=5, delay=0.2)
+@retry(times=5, delay=0.2, exceptions=(ZeroDivisionError,))   # only retry the errors you expect, not every bug
 def flaky():
     return 1 / 0
 
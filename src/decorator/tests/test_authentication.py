@@ -0,0 +1,52 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from decorator_authentication_demo1 import auth
+
+
+def test_auth_positional_and_keyword_user():
+    """A validated user passes whether given positionally or by keyword; others are denied."""
+    @auth
+    def view(user, database_name):
+        return f"{database_name} opened by {user}"
+
+    assert view("John", "dev") == "dev opened by John"
+    assert view(user="John", database_name="dev") == "dev opened by John"
+    with pytest.raises(PermissionError):
+        view("Hacker", "prod")
+    with pytest.raises(PermissionError):
+        view(user="Hacker", database_name="prod")
+
+
+def test_auth_keyword_only_user_after_varargs():
+    """With f(*tables, user), a validated name among the tables must not authorize the caller."""
+    @auth
+    def view(*tables, user):
+        return f"{tables} opened by {user}"
+
+    assert view("x", user="John") == "('x',) opened by John"
+    with pytest.raises(PermissionError):
+        view("x", "John", user="Hacker")
+
+
+def test_auth_keyword_only_user():
+    """A keyword-only user is always read from the keyword arguments."""
+    @auth
+    def view(database_name, *, user):
+        return f"{database_name} opened by {user}"
+
+    assert view("dev", user="Mike") == "dev opened by Mike"
+    with pytest.raises(PermissionError):
+        view("John", user="Hacker")
+
+
+def test_auth_requires_user_parameter():
+    """Decorating a function without a user parameter fails with a clear TypeError."""
+    with pytest.raises(TypeError, match="auth requires a 'user' parameter"):
+        @auth
+        def view(database_name):
+            pass
@@ -5,6 +5,10 @@ How to use lambda functions in Python.
     3. How to define a lambda function: lambda arguments: expression (usually use in a mathmatical expression)
 """
 from functools import wraps
+from operator import itemgetter
+
+import numpy as np
+
 # 1. Basic  -- anoynmous function
 def divide_by_zero(func):
     @wraps(func)
@@ -28,10 +32,15 @@ print(f"res: {res}")
 def add_tax_for_salary(salary, tax_rate):
     return list(map(lambda s: s * (1 - tax_rate), salary))
 
+def add_tax_for_salary_np(salary, tax_rate):
+    # same result without the lambda: numpy does the loop in C, faster for long salary lists
+    return (np.asarray(salary, dtype=np.float64) * (1.0 - tax_rate)).tolist()
+
 salary = [100000, 90000, 80000]
 tax_rate = 0.4
 
 print(f"Salary after tax: {add_tax_for_salary(salary=salary, tax_rate=tax_rate)}")
+print(f"Salary after tax (numpy): {add_tax_for_salary_np(salary=salary, tax_rate=tax_rate)}")
 
 
 products = [
@@ -44,6 +53,17 @@ products = [
 sorted_price = sorted(products, key=lambda p: p['price'])
 print(f"Sorted by price for products: {sorted_price}")
 
+# same result: itemgetter('price') does what lambda p: p['price'] does, but in C
+sorted_price = sorted(products, key=itemgetter('price'))
+print(f"Sorted by price for products (itemgetter): {sorted_price}")
+
 # sort by length of name, descending
 sorted_name_len = sorted(products, key=lambda p: len(p['name']), reverse=True)
 print(f"Sorted by name for products: {sorted_name_len}")
+
+# same result without a key function: decorate, sort, undecorate
+# (-len, index) keeps ties in original order, like sorted(..., reverse=True) does
+decorated = [(-len(p['name']), i, p) for i, p in enumerate(products)]
+decorated.sort()
+sorted_name_len = [p for _, _, p in decorated]
+print(f"Sorted by name for products (decorate-sort-undecorate): {sorted_name_len}")
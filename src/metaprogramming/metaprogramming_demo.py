@@ -1,15 +1,26 @@
+from dataclasses import make_dataclass
+from functools import cache
+
+
 def create_user_class(class_name, attributes):
     """Dynamically creates a user class with given attributes."""
-    def __init__(self, **kwargs):
-        for attr, value in kwargs.items():
-            if attr in attributes:
-                setattr(self, attr, value)
-            else:
-                raise AttributeError(f"Invalid attribute: {attr}")
-    class_attrs = {"__init__": __init__}
-    for attr in attributes:
-        class_attrs[attr] = None
-    return type(class_name, (object,), class_attrs)
+    # lists are unhashable, so pass a tuple to the cached builder
+    return _build_user_class(class_name, tuple(attributes))
+
+
+# Unbounded cache with no lock: a hit is one dict lookup, which is atomic under the GIL,
+# so concurrent request threads share the same class objects without contention.
+@cache
+def _build_user_class(class_name, attributes):
+    """Builds the class once per (class_name, attributes); repeated calls return the same class."""
+    # make_dataclass writes the code for us: it execs an __init__ with the exact signature
+    #   def __init__(self, *, username=None, email=None): self.username = username; ...
+    # plus __repr__. slots=True drops the per-instance __dict__, so instances get the
+    # fixed-offset layout a Cython cdef class would give, without a compile step.
+    # eq=False keeps identity equality and hashing, so users still work in sets and as dict keys
+    # (eq=True would set __hash__ = None).
+    fields = [(attr, object, None) for attr in attributes]
+    return make_dataclass(class_name, fields, eq=False, kw_only=True, slots=True)
 
 BasicUser = create_user_class("BasicUser", ["username", "email"])
 PremiumUser = create_user_class("PremiumUser", ["username", "email", "subscription_level"]) # Corrected line
@@ -26,7 +37,8 @@ Say you're building a program that needs to create different types of user accou
 Instead of defining separate classes for each account type, you can use metaprogramming to create them dynamically.
 
 In the example, the create_user_class function takes a class name and a list of attributes as input. It then uses 
-the type() function to dynamically create a new class with those attributes. This allows you to generate classes 
+dataclasses.make_dataclass (which generates the methods and calls type() under the hood) to dynamically create a 
+new class with those attributes. This allows you to generate classes 
 dynamically, adapting your code to different needs without writing repetitive class definitions.
 
 These examples showcase the power and flexibility of metaprogramming in Python. By understanding these concepts, 
@@ -30,6 +30,42 @@ import re
 """
 import re
 
-# 1. find all letter and digits in a string
-letters = re.findall("[a-zA-Z0-9]", "abc0934lijiufeng!@0924")
-print(letters)
\ No newline at end of file
+# Compile once at import; calling the bound method skips re's internal pattern cache lookup
+_ALNUM_RE = re.compile(r"[A-Za-z0-9]")
+
+# Every ASCII byte that is not a letter or digit, for bytes.translate(None, delete)
+_NON_ALNUM_BYTES = bytes(i for i in range(128) if not chr(i).isalnum())
+
+
+def _keep_alnum(s):
+    """Return only the ASCII letters and digits of s, as one string."""
+    # encode(ignore) drops non-ASCII chars, which [A-Za-z0-9] would not match either
+    return s.encode("ascii", "ignore").translate(None, _NON_ALNUM_BYTES).decode("ascii")
+
+
+def find_alnum(s):
+    """Same result as _ALNUM_RE.findall(s), but one C-level delete pass instead of the regex engine."""
+    # A DFA engine (re2, Hyperscan) would not beat this: every alnum char is its own match,
+    # and those engines report each match through a Python callback.
+    return list(_keep_alnum(s))
+
+
+def find_alnum_batch(strings):
+    """find_alnum for many strings."""
+    # Deliberately sequential. Threads would not help: neither re nor translate releases the GIL.
+    # A process pool did not win either: shipping strings to workers and the result lists back
+    # costs about as much as the C-level translate pass it parallelizes.
+    return [find_alnum(s) for s in strings]
+
+
+if __name__ == "__main__":
+    # 1. find all letter and digits in a string
+    letters = _ALNUM_RE.findall("abc0934lijiufeng!@0924")
+    print(letters)
+
+    # 2. same result without regex: when a plain string op suffices, it is usually faster
+    letters = find_alnum("abc0934lijiufeng!@0924")
+    print(letters)
+
+    # 3. many strings at once
+    print(find_alnum_batch(["abc!@1", "x-y_z 2"]))
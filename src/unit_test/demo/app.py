@@ -1,39 +1,123 @@
+import os
+import threading
+
+import fastjsonschema
+import orjson
 from flask import Flask, request, jsonify, render_template
+from flask.json.provider import JSONProvider
+from jinja2 import FileSystemBytecodeCache
+
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson, used by jsonify() and response.json."""
+    mimetype = 'application/json'
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # orjson already returns bytes, so skip the str round-trip of the default provider
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj), mimetype=self.mimetype)
+
+
+class _LazyBytecodeCache(FileSystemBytecodeCache):
+    """Bytecode cache that creates its directory on first write and is skipped when it can't be used."""
+
+    def load_bytecode(self, bucket):
+        try:
+            super().load_bytecode(bucket)
+        except OSError:
+            pass    # unusable cache path: compile the template as if nothing was cached
+
+    def dump_bytecode(self, bucket):
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            super().dump_bytecode(bucket)
+        except OSError:
+            pass    # e.g. a read-only deploy: templates still render, compiled in memory only
+
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)  # compact, unsorted output serialized in C
+
+# Production settings: templates are compiled once
+app.config.update(TEMPLATES_AUTO_RELOAD=False)
+
+# Keep compiled template bytecode on disk so restarts skip recompiling index.html.
+# JINJA_CACHE_DIR overrides the location; set it to an empty string to disable the cache.
+_JINJA_CACHE_DIR = os.environ.get('JINJA_CACHE_DIR', os.path.join(app.root_path, '.jinja_cache'))
+if _JINJA_CACHE_DIR:
+    app.jinja_env.bytecode_cache = _LazyBytecodeCache(_JINJA_CACHE_DIR)
 
 # Initialize posts as an empty list
+# A list is the right fit here: appends are amortized O(1) and GET /posts serializes all of it.
+# (A deque(maxlen=N) would bound memory but also recycle len()-based ids and breaks `posts == []`.)
 posts = []
 
+# Compiled once into straight-line Python that checks exactly this shape
+_validate_post = fastjsonschema.compile({
+    'type': 'object',
+    'required': ['title', 'content'],
+    'properties': {
+        'title': {'type': 'string'},
+        'content': {'type': 'string'}
+    }
+})
+
+# Guards id assignment + append so two threads never hand out the same id
+_posts_lock = threading.Lock()
+
 @app.route('/')
 def index():
     return render_template('index.html')
 
+def _stream_json_array(items, batch_size=256):
+    """Yield a JSON array chunk by chunk so the full body is never held in memory at once."""
+    yield b'['
+    for start in range(0, len(items), batch_size):
+        if start:
+            yield b','
+        # dumps a batch as "[a,b,...]" and strips the brackets; batching avoids one tiny write per post
+        yield orjson.dumps(items[start:start + batch_size])[1:-1]
+    yield b']'
+
 @app.route('/posts', methods=['GET'])
 def get_posts():
     # STEP 3: Return all posts as JSON with status code 200
-    return jsonify(posts), 200
+    return app.response_class(_stream_json_array(posts), mimetype='application/json'), 200
 
 @app.route('/posts', methods=['POST'])
 def create_post():
-    data = request.get_json()
+    # Parse the raw body bytes directly; get_json() would also cache the parsed body on the request
+    try:
+        data = orjson.loads(request.get_data(cache=False))
+    except orjson.JSONDecodeError:
+        return jsonify({'error': 'Invalid JSON'}), 400
 
     # STEP 4.2: Validate the data to ensure it exists, it has a 'title' and a 'content'
-    if not data or 'title' not in data or 'content' not in data:
+    try:
+        _validate_post(data)
+    except fastjsonschema.JsonSchemaException:
         return jsonify({'error': 'Invalid data'}), 400
     
     # STEP 4.3: Create a new post dictionary with an ID, title, and content from the data variable
-    new_post = {
-        'id': len(posts) + 1,
-        'title': data['title'],
-        'content': data['content']
-    }
-    
-    # Append the new post to the 'posts' list
-    posts.append(new_post)
+    # Append the new post to the 'posts' list in the same critical section that picks its id
+    with _posts_lock:
+        new_post = {
+            'id': len(posts) + 1,
+            'title': data['title'],
+            'content': data['content']
+        }
+        posts.append(new_post)
     
     # Return the new post as JSON with a 201 Created status code
     return jsonify(new_post), 201
 
 if __name__ == '__main__':
-    app.run(debug=True)
\ No newline at end of file
+    # Development server only; in production run a WSGI server, e.g. gunicorn -w 1 --threads 8 app:app
+    # (one process: posts is an in-process list, so more workers would each have their own)
+    app.run(debug=False)
\ No newline at end of file
@@ -0,0 +1,98 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app import app
+
+
+def test_concurrent_posts_get_unique_ids(mocker):
+    """
+    Test that concurrent POSTs never share an id.
+
+    The id is len(posts) + 1, so it must be picked and appended in one
+    critical section; 500 requests from 16 threads must yield ids 1..500.
+    """
+    mock_posts = []
+    mocker.patch('app.posts', mock_posts)
+
+    def create(i):
+        with app.test_client() as client:
+            data = {'title': f'Post {i}', 'content': 'Content'}
+            return client.post('/posts', data=json.dumps(data), content_type='application/json')
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        responses = list(pool.map(create, range(500)))
+
+    assert all(response.status_code == 201 for response in responses)
+    assert sorted(response.json['id'] for response in responses) == list(range(1, 501))
+    assert sorted(post['id'] for post in mock_posts) == list(range(1, 501))
+
+
+@pytest.mark.parametrize('data', [
+    {'title': 1, 'content': 'Test Content'},
+    {'title': 'Test Post', 'content': None},
+    {'title': ['Test Post'], 'content': {'text': 'Test Content'}},
+])
+def test_create_post_non_string_fields(client, mocker, data):
+    """
+    Test that title and content must be strings.
+
+    Verifies that the schema validator rejects other JSON types with 400
+    and that nothing is appended to posts.
+    """
+    mock_posts = []
+    mocker.patch('app.posts', mock_posts)
+
+    response = client.post('/posts', data=json.dumps(data), content_type='application/json')
+    assert response.status_code == 400
+    assert response.json == {'error': 'Invalid data'}
+    assert mock_posts == []
+
+
+@pytest.mark.parametrize('count', [0, 1, 255, 256, 257, 1000])
+def test_get_posts_streams_all_batches(client, mocker, count):
+    """
+    Test the streamed GET /posts response around the 256-post batch size.
+
+    Verifies that the body is streamed and that joining the batches gives
+    one valid JSON array with every post in order.
+    """
+    mock_posts = [{'id': i, 'title': f'Post {i}', 'content': 'Content'} for i in range(1, count + 1)]
+    mocker.patch('app.posts', mock_posts)
+
+    response = client.get('/posts')
+    assert response.status_code == 200
+    assert response.is_streamed
+    assert response.mimetype == 'application/json'
+    assert json.loads(response.get_data()) == mock_posts
+
+
+@pytest.mark.parametrize('body', [b'{"title": "Test Post",', b'not json', b''])
+def test_create_post_malformed_json(client, mocker, body):
+    """
+    Test that a body that is not valid JSON gets a JSON 400 error.
+    """
+    mock_posts = []
+    mocker.patch('app.posts', mock_posts)
+
+    response = client.post('/posts', data=body, content_type='application/json')
+    assert response.status_code == 400
+    assert response.json == {'error': 'Invalid JSON'}
+    assert mock_posts == []
+
+
+def test_create_post_any_content_type(client, mocker):
+    """
+    Test that the body is parsed as JSON whatever the Content-Type header says.
+
+    create_post reads the raw body, so a JSON payload sent as text/plain is
+    accepted instead of getting 415 Unsupported Media Type.
+    """
+    mock_posts = []
+    mocker.patch('app.posts', mock_posts)
+
+    data = {'title': 'Test Post', 'content': 'Test Content'}
+    response = client.post('/posts', data=json.dumps(data), content_type='text/plain')
+    assert response.status_code == 201
+    assert mock_posts == [{'id': 1, 'title': 'Test Post', 'content': 'Test Content'}]